@@ -12,12 +12,18 @@ Press Ctrl+C to exit.
 """
 
 import asyncio
+import io
 import os
+import re
+import shutil
 import sys
 import time
 import signal
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import zip_longest
 from pathlib import Path
-from datetime import datetime
 
 # Import Sliver protobuf definitions
 try:
@@ -31,11 +37,52 @@ except ImportError:
 
 
 # Global state for change detection
-PREVIOUS_AGENTS = {}  # Store agent IDs from last refresh
-AGENT_FIRST_SEEN = {}  # Track when each agent was first detected
-LOST_AGENTS = {}  # Track recently lost agents with timestamp
+PREVIOUS_AGENT_SNAPSHOT = {}  # Agent ID -> Agent from last refresh
+AGENT_FIRST_SEEN = {}  # Track when each agent was first detected (time.monotonic)
+LOST_AGENTS = {}  # Track recently lost agents with timestamp (time.monotonic)
+RENDER_CACHE = {}  # Agent ID -> (render key, formatted line fragments)
+PREVIOUS_FRAME = []  # Lines currently shown on the terminal (see render_frame)
+PREVIOUS_FRAME_ROWS = None  # Terminal rows each PREVIOUS_FRAME line wraps onto (None if it scrolled)
+PREVIOUS_TERMINAL_SIZE = None  # Terminal size PREVIOUS_FRAME was drawn at
+FRAME_BUFFER = io.StringIO()  # Reused by draw_graph for every frame
+LAST_FRAME_FINGERPRINT = None  # frame_fingerprint of the last drawn frame
+LAST_AGENT_SIGNATURE = None  # agent_list_signature of the last refresh
+LAST_AGENT_TREE = []  # Agent tree built for LAST_AGENT_SIGNATURE
+CONFIG_CACHE = None  # (config path, mtime, parsed SliverClientConfig)
+PIVOT_CACHE = {}  # (ProxyURL, hostname, transport) -> parent root ID or None
+PIVOT_CACHE_ROOTS = ()  # (ID, hostname) of the roots PIVOT_CACHE was built against, in order
+UPDATE_LINE_INDEX = 4  # Frame line holding the 'Last Update' timestamp
 NEW_AGENT_TIMEOUT = 300  # Mark as "new" for 5 minutes (300 seconds)
 LOST_AGENT_DISPLAY_TIME = 300  # Show lost agents for 5 minutes
+MAX_LOST_AGENTS = 200  # Cap on remembered lost agents under heavy churn
+MAX_RECONNECT_DELAY = 60  # Cap for exponential reconnect backoff (seconds)
+MAX_REDRAWS_PER_SECOND = 2  # Coalesce bursts of server events into fewer redraws
+EVENT_DEBOUNCE = 0.1  # Quiet period (seconds) that ends a burst of server events
+STDOUT_BUFFER_SIZE = 65536  # Large enough to hold a whole frame
+KEEPALIVE_INTERVAL = 30  # Seconds between connection health checks
+KEEPALIVE_TIMEOUT = 10  # Seconds to wait for a health check reply
+
+# Sliver server event types that change the agent list
+SESSION_UPSERT_EVENTS = {'session-connected', 'session-updated'}
+SESSION_REMOVE_EVENTS = {'session-disconnected'}
+BEACON_EVENTS = {'beacon-registered'}
+
+# Splits a pivot ProxyURL into candidate parent IDs/hostnames
+PROXY_URL_TOKEN_RE = re.compile(r'[\w.-]+')
+
+# Precompiled classifiers (one C-level scan instead of several `in` checks)
+PRIVILEGED_WINDOWS_USER_RE = re.compile(r'administrator|nt authority\\system|system|admin')
+PRIVILEGED_WINDOWS_SID_RE = re.compile(r'S-1-5-18|-500$')  # SYSTEM or RID 500
+PROTOCOL_RE = re.compile(r'http|tls|dns|tcp')  # 'tls' also matches mtls
+PIVOT_TRANSPORT_RE = re.compile(r'pivot|namedpipe|bind')
+SAME_HOST_PIVOT_RE = re.compile(r'pivot|namedpipe')
+ANSI_ESCAPE_RE = re.compile(r'\033\[[0-9;?]*[A-Za-z]')
+LINUX_OS_PREFIXES = ('linux', 'ubuntu', 'debian')
+
+
+CLEAR_SCREEN = '\033[H\033[2J\033[3J'  # Cursor home + erase display and scrollback
+HIDE_CURSOR = '\033[?25l'
+SHOW_CURSOR = '\033[?25h'
 
 
 class Colors:
@@ -57,101 +104,303 @@ class Colors:
     MAGENTA = '\033[95m'
     CYAN = '\033[96m'
     WHITE = '\033[97m'
+    # Bold + color as a single SGR sequence
+    BOLD_GRAY = '\033[1;90m'
+    BOLD_RED = '\033[1;91m'
+    BOLD_GREEN = '\033[1;92m'
+    BOLD_YELLOW = '\033[1;93m'
+    BOLD_CYAN = '\033[1;96m'
+
+
+def normalize_os(os_lower):
+    """Map a lowercased Sliver OS string to 'windows', 'linux' or 'other'"""
+    # Sliver reports Go's GOOS, so the leading word decides the family
+    if os_lower.startswith('win'):
+        return 'windows'
+    if os_lower.startswith(LINUX_OS_PREFIXES):
+        return 'linux'
+    return 'other'
+
+
+# OS family -> computer ASCII art
+COMPUTER_ART = {
+    'windows': (
+        "┌─────┐",
+        "│ ▄▄  │",
+        "│ ▀▀  │",
+        "└─────┘",
+        "┌─────┐",
+        "└─────┘",
+    ),
+    'linux': (
+        "┌─────┐",
+        "│ ╱╲  │",
+        "│▕  ▏ │",
+        "└─────┘",
+        "┌─────┐",
+        "└─────┘",
+    ),
+    'other': (
+        "┌─────┐",
+        "│ ▄▄▄ │",
+        "│ ███ │",
+        "└─────┘",
+        "┌─────┐",
+        "└─────┘",
+    ),
+}
 
 
 def draw_computer(os_name):
     """Draw a computer ASCII art based on OS"""
-    os_lower = os_name.lower() if os_name else ''
+    return COMPUTER_ART[normalize_os(os_name.lower() if os_name else '')]
+
+
+SLIVER_LOGO = (
+    "   🎯 C2    ",
+    "  ▄████▄   ",
+    "  ████████  ",
+    "  ▀██████▀  ",
+    "    ▀██▀    ",
+)
+
+
+# Frame pieces that never change, formatted once at import time
+HEADER = (
+    f"{Colors.BOLD_CYAN}╔════════════════════════════════════════════════════════════════════════════╗{Colors.ENDC}\n"
+    f"{Colors.BOLD_CYAN}║  🎯 SLIVER C2 - NETWORK TOPOLOGY VISUALIZATION                            ║{Colors.ENDC}\n"
+    f"{Colors.BOLD_CYAN}╚════════════════════════════════════════════════════════════════════════════╝{Colors.ENDC}\n"
+)
+LOGO_CELLS = tuple(f"{Colors.MAGENTA}{line:12}{Colors.ENDC}" for line in SLIVER_LOGO)
+BLANK_LOGO_CELL = " " * 12
+
+
+# (OS family, is_session) -> emoji icon
+PC_ICONS = {
+    ('windows', True): "🖥️ ",
+    ('windows', False): "💻",
+    ('linux', True): "🐧",
+    ('linux', False): "🖳 ",
+    ('other', True): "💻",
+    ('other', False): "🖥️ ",
+}
+
+# Transport protocol -> color. Common transports are listed whole so they
+# resolve with one lookup; the short keys are what PROTOCOL_RE matches.
+PROTOCOL_COLORS = {
+    'http': Colors.GREEN,
+    'https': Colors.GREEN,
+    'mtls': Colors.CYAN,
+    'tls': Colors.CYAN,
+    'dns': Colors.YELLOW,
+    'tcp': Colors.BLUE,
+}
+
+
+@lru_cache(maxsize=512)
+def get_protocol_color(transport_lower):
+    """Get color for a lowercased transport protocol"""
+    color = PROTOCOL_COLORS.get(transport_lower)
+    if color is not None:
+        return color
+    
+    # Fall back to a substring match for compound names (e.g. 'http(s)')
+    match = PROTOCOL_RE.search(transport_lower)
+    if match:
+        return PROTOCOL_COLORS[match.group()]
+    return Colors.WHITE
+
+
+def enable_ansi():
+    """Enable ANSI escape processing (needed once on Windows 10+ consoles)"""
+    if os.name != 'nt':
+        return
+    
+    # Set ENABLE_VIRTUAL_TERMINAL_PROCESSING on the console directly
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_ulong()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            if kernel32.SetConsoleMode(handle, mode.value | 0x0004):
+                return
+    except (AttributeError, OSError):
+        pass
+    
+    # Fallback: an empty system() call switches conhost into VT processing mode
+    os.system('')
+
+
+def setup_stdout():
+    """
+    Replace sys.stdout with a 64 KiB block-buffered writer
     
-    if 'windows' in os_lower:
-        return [
-            "┌─────┐",
-            "│ ▄▄  │",
-            "│ ▀▀  │",
-            "└─────┘",
-            "┌─────┐",
-            "└─────┘"
-        ]
-    elif 'linux' in os_lower:
-        return [
-            "┌─────┐",
-            "│ ╱╲  │",
-            "│▕  ▏ │",
-            "└─────┘",
-            "┌─────┐",
-            "└─────┘"
-        ]
-    else:
-        return [
-            "┌─────┐",
-            "│ ▄▄▄ │",
-            "│ ███ │",
-            "└─────┘",
-            "┌─────┐",
-            "└─────┘"
-        ]
-
-
-def draw_sliver_logo():
-    """Draw Sliver C2 logo with emoji"""
-    return [
-        "   🎯 C2    ",
-        "  ▄████▄   ",
-        "  ████████  ",
-        "  ▀██████▀  ",
-        "    ▀██▀    "
-    ]
-
-
-def get_protocol_color(transport):
-    """Get color for transport protocol"""
-    transport_lower = transport.lower() if transport else ''
-    if 'http' in transport_lower:
-        return Colors.GREEN
-    elif 'mtls' in transport_lower or 'tls' in transport_lower:
-        return Colors.CYAN
-    elif 'dns' in transport_lower:
-        return Colors.YELLOW
-    elif 'tcp' in transport_lower:
-        return Colors.BLUE
+    Frames are flushed explicitly once they are complete, so line buffering
+    on a TTY would only split each frame into many small writes.
+    """
+    sys.stdout.flush()
+    sys.stdout = open(sys.stdout.fileno(), 'w', buffering=STDOUT_BUFFER_SIZE,
+                      encoding=sys.stdout.encoding, errors=sys.stdout.errors, closefd=False)
+
+
+def write_terminal(text):
+    """Encode text once and write it to the terminal in a single write + flush"""
+    stream = getattr(sys.stdout, 'buffer', None)
+    if stream is None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    
+    # Flush the text layer first so earlier print() output stays in order
+    sys.stdout.flush()
+    stream.write(text.encode(sys.stdout.encoding or 'utf-8', sys.stdout.errors or 'strict'))
+    stream.flush()
+
+
+@lru_cache(maxsize=1024)
+def display_width(line):
+    """
+    Estimate how many terminal columns a frame line occupies
+    
+    ANSI escapes take no space, wide (East Asian / emoji) characters take
+    two columns and combining marks none. An emoji presentation selector
+    (U+FE0F) widens the preceding glyph to two columns.
+    """
+    width = 0
+    for ch in ANSI_ESCAPE_RE.sub('', line):
+        if ch == '\ufe0f':
+            width += 1
+        elif unicodedata.category(ch) in ('Mn', 'Me', 'Cf'):
+            continue
+        elif unicodedata.east_asian_width(ch) in ('W', 'F'):
+            width += 2
+        else:
+            width += 1
+    return width
+
+
+def frame_rows(lines, size):
+    """
+    Work out how many terminal rows each frame line occupies once wrapped
+    
+    A line exactly as wide as the terminal still takes a single row
+    (terminals defer the wrap until the next character). Returns None when
+    the frame plus the cursor row below it would scroll the screen, since
+    absolute row addressing is meaningless then.
+    """
+    rows = [max(1, -(-display_width(line) // size.columns)) for line in lines]
+    if sum(rows) >= size.lines:
+        return None
+    return rows
+
+
+def render_frame(graph):
+    """
+    Draw a frame, rewriting only the terminal lines that changed
+    
+    The first frame (or any frame after PREVIOUS_FRAME is cleared) clears the
+    screen and is written in full. Later frames are diffed line by line
+    against PREVIOUS_FRAME and only differing rows are rewritten in place
+    using cursor positioning, batched into a single write. Lines that wrap
+    are addressed by their cumulative row offset; once a line changes how
+    many rows it wraps onto, everything below it is rewritten. A frame
+    identical to the previous one writes nothing at all. Frames that would
+    scroll, and any frame after a terminal resize, are redrawn in full.
+    """
+    global PREVIOUS_FRAME, PREVIOUS_FRAME_ROWS, PREVIOUS_TERMINAL_SIZE
+    
+    lines = graph.split('\n')
+    size = shutil.get_terminal_size()
+    
+    # Fast path: cheap length check first, then full compare
+    if size == PREVIOUS_TERMINAL_SIZE and len(lines) == len(PREVIOUS_FRAME) and lines == PREVIOUS_FRAME:
+        return
+    
+    rows = frame_rows(lines, size)
+    out = []
+    
+    if not (PREVIOUS_FRAME and rows and PREVIOUS_FRAME_ROWS and size == PREVIOUS_TERMINAL_SIZE):
+        # Full redraw (row addressing breaks once the frame scrolls)
+        out.append(CLEAR_SCREEN)
+        out.append(graph)
     else:
-        return Colors.WHITE
+        top = 0
+        for index, (old, new, old_rows, new_rows) in enumerate(
+                zip_longest(PREVIOUS_FRAME, lines, PREVIOUS_FRAME_ROWS, rows)):
+            if new is None:
+                # Erase leftovers when the new frame is shorter
+                out.append(f"\033[{top + 1};1H\033[J")
+                break
+            if old_rows != new_rows:
+                # Every row below shifts, so rewrite the rest of the frame
+                out.append(f"\033[{top + 1};1H\033[J")
+                out.append('\n'.join(lines[index:]))
+                break
+            if old != new:
+                for row in range(top, top + new_rows):
+                    out.append(f"\033[{row + 1};1H\033[2K")
+                out.append(f"\033[{top + 1};1H{new}")
+            top += new_rows
+        
+        # Leave the cursor below the frame
+        out.append(f"\033[{sum(rows)};1H")
+    
+    out.append('\n')
+    write_terminal(''.join(out))
+    PREVIOUS_FRAME = lines
+    PREVIOUS_FRAME_ROWS = rows
+    PREVIOUS_TERMINAL_SIZE = size
 
 
-def clear_screen():
-    """Clear the terminal screen"""
-    os.system('clear' if os.name != 'nt' else 'cls')
+def render_update_line(line):
+    """
+    Rewrite only the 'Last Update' row of the frame on screen
+    
+    Used when nothing else in the frame changed. The cursor is saved and
+    restored around the write so it stays parked below the frame. Falls
+    back to render_frame when the frame on screen scrolled, was drawn at
+    another terminal size, or the new line wraps onto a different number of
+    rows (absolute row addressing would land on the wrong row).
+    """
+    size = shutil.get_terminal_size()
+    if PREVIOUS_FRAME[UPDATE_LINE_INDEX] == line and size == PREVIOUS_TERMINAL_SIZE:
+        return
+    
+    if (not PREVIOUS_FRAME_ROWS or size != PREVIOUS_TERMINAL_SIZE
+            or frame_rows([line], size) != PREVIOUS_FRAME_ROWS[UPDATE_LINE_INDEX:UPDATE_LINE_INDEX + 1]):
+        frame = list(PREVIOUS_FRAME)
+        frame[UPDATE_LINE_INDEX] = line
+        render_frame('\n'.join(frame))
+        return
+    
+    top = sum(PREVIOUS_FRAME_ROWS[:UPDATE_LINE_INDEX])
+    clear = ''.join(f"\033[{row + 1};1H\033[2K" for row in range(top, top + PREVIOUS_FRAME_ROWS[UPDATE_LINE_INDEX]))
+    write_terminal(f"\0337{clear}\033[{top + 1};1H{line}\0338")
+    PREVIOUS_FRAME[UPDATE_LINE_INDEX] = line
 
 
-def is_privileged(username, uid, os_name):
-    """Detect if session is running with elevated privileges"""
-    username_lower = username.lower() if username else ''
-    os_lower = os_name.lower() if os_name else ''
+@lru_cache(maxsize=512)
+def is_privileged(username_lower, uid, os_lower):
+    """
+    Detect if session is running with elevated privileges
+    
+    Expects the username and OS already lowercased (see annotate_agent).
+    """
     uid_str = str(uid) if uid else ''
     
     # Windows privilege detection
     if 'windows' in os_lower:
-        # Check for well-known privileged accounts
-        privileged_names = [
-            'administrator',
-            'system',
-            'nt authority\\system',
-            'admin',
-        ]
-        
-        # Check username
-        for priv_name in privileged_names:
-            if priv_name in username_lower:
-                return True
+        # Check username for well-known privileged accounts
+        if PRIVILEGED_WINDOWS_USER_RE.search(username_lower):
+            return True
         
         # Check Windows SID (Security Identifier)
         # S-1-5-18 = SYSTEM
         # S-1-5-19 = LOCAL SERVICE
         # S-1-5-20 = NETWORK SERVICE
         # S-1-5-*-500 = Administrator (RID 500)
-        if 'S-1-5-18' in uid_str:  # SYSTEM
-            return True
-        if uid_str.endswith('-500'):  # Administrator account (RID 500)
+        if PRIVILEGED_WINDOWS_SID_RE.search(uid_str):
             return True
     
     # Linux/Unix privilege detection
@@ -199,46 +448,45 @@ def track_agent_changes(agent_tree):
     Returns:
         dict with 'new_count', 'lost_count' keys
     """
-    global PREVIOUS_AGENTS, AGENT_FIRST_SEEN, LOST_AGENTS
+    global PREVIOUS_AGENT_SNAPSHOT, AGENT_FIRST_SEEN, LOST_AGENTS
     
-    current_time = time.time()
+    current_time = time.monotonic()
     
     # Flatten agent tree to get all agent IDs
-    current_agents = {}
-    for agent in agent_tree:
-        current_agents[agent['ID']] = agent
-        for child in agent.get('children', []):
-            current_agents[child['ID']] = child
-    
-    current_ids = set(current_agents.keys())
-    previous_ids = set(PREVIOUS_AGENTS.keys())
+    current_agents = {
+        a.id: a
+        for root in agent_tree
+        for a in (root, *root.children)
+    }
     
-    # Detect new agents
-    new_ids = current_ids - previous_ids
+    # Set difference directly on the key views (no intermediate sets)
+    new_ids = current_agents.keys() - PREVIOUS_AGENT_SNAPSHOT.keys()
     for agent_id in new_ids:
         if agent_id not in AGENT_FIRST_SEEN:
             AGENT_FIRST_SEEN[agent_id] = current_time
     
     # Detect lost agents
-    lost_ids = previous_ids - current_ids
+    lost_ids = PREVIOUS_AGENT_SNAPSHOT.keys() - current_agents.keys()
     for agent_id in lost_ids:
-        if agent_id in PREVIOUS_AGENTS:
-            LOST_AGENTS[agent_id] = {
-                'agent': PREVIOUS_AGENTS[agent_id],
-                'lost_time': current_time
-            }
-    
-    # Clean up old lost agents (older than display time)
-    expired_lost = []
-    for agent_id, data in LOST_AGENTS.items():
-        if current_time - data['lost_time'] > LOST_AGENT_DISPLAY_TIME:
-            expired_lost.append(agent_id)
+        RENDER_CACHE.pop(agent_id, None)
+        # Re-insert so LOST_AGENTS stays ordered by lost_time
+        LOST_AGENTS.pop(agent_id, None)
+        LOST_AGENTS[agent_id] = {
+            'agent': PREVIOUS_AGENT_SNAPSHOT[agent_id],
+            'lost_time': current_time
+        }
     
-    for agent_id in expired_lost:
-        del LOST_AGENTS[agent_id]
+    # Clean up old lost agents (older than display time, or beyond the cap).
+    # Entries are in lost_time order, so only the oldest need checking.
+    while LOST_AGENTS:
+        oldest_id = next(iter(LOST_AGENTS))
+        if (len(LOST_AGENTS) <= MAX_LOST_AGENTS and
+                current_time - LOST_AGENTS[oldest_id]['lost_time'] <= LOST_AGENT_DISPLAY_TIME):
+            break
+        del LOST_AGENTS[oldest_id]
     
-    # Update previous state
-    PREVIOUS_AGENTS = current_agents.copy()
+    # Update previous state (current_agents is freshly built, no copy needed)
+    PREVIOUS_AGENT_SNAPSHOT = current_agents
     
     return {
         'new_count': len(new_ids),
@@ -259,470 +507,467 @@ def is_agent_new(agent_id):
     if agent_id not in AGENT_FIRST_SEEN:
         return False
     
-    time_since_first_seen = time.time() - AGENT_FIRST_SEEN[agent_id]
+    time_since_first_seen = time.monotonic() - AGENT_FIRST_SEEN[agent_id]
     return time_since_first_seen < NEW_AGENT_TIMEOUT
 
 
-def count_unique_hosts(agent_tree):
+def agent_render_key(agent, is_new):
+    """Tuple of every agent field that affects how the agent is rendered"""
+    return (
+        agent.type, agent.hostname, agent.username, agent.os,
+        agent.transport, agent.uid, agent.is_dead, agent.remote_address, is_new
+    )
+
+
+def format_update_line(last_update):
+    """Format the 'Last Update' status line shown under the header"""
+    update_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(last_update))
+    return f"{Colors.GRAY}  ⏰ Last Update: {update_time}  |  Press Ctrl+C to exit{Colors.ENDC}"
+
+
+def format_time_ago(lost_time):
+    """Format how long ago an agent was lost, e.g. '42s ago' or '3m ago'"""
+    time_ago = int(time.monotonic() - lost_time)
+    if time_ago < 60:
+        return f"{time_ago}s ago"
+    return f"{time_ago // 60}m ago"
+
+
+def frame_fingerprint(agent_tree, total_sessions, total_beacons, changes):
+    """
+    Hash everything draw_graph would render, except the update timestamp
+    
+    Two refreshes with the same fingerprint produce identical frames apart
+    from the 'Last Update' line, so the redraw can be skipped.
+    """
+    agents = tuple(
+        (
+            agent.id, agent_render_key(agent, is_agent_new(agent.id)),
+            tuple((child.id, agent_render_key(child, is_agent_new(child.id)))
+                  for child in agent.children)
+        )
+        for agent in agent_tree
+    )
+    lost = tuple((agent_id, format_time_ago(data['lost_time'])) for agent_id, data in LOST_AGENTS.items())
+    
+    return hash((agents, lost, total_sessions, total_beacons, changes['new_count'], changes['lost_count']))
+
+
+def render_agent_lines(agent, is_new):
     """
-    Count unique compromised hosts based on hostname
+    Render the agent-specific parts of an agent's three display lines
+    
+    Results are memoized in RENDER_CACHE and reused while none of the fields
+    that affect rendering change, so stable agents are not reformatted on
+    every refresh.
     
     Args:
-        agent_tree: List of root agents with their children
+        agent: Agent from build_agent_tree
+        is_new: Whether the agent should get the NEW badge
     
     Returns:
-        Integer count of unique hostnames
+        Tuple of (summary, id_line, ip_line) strings, where summary starts at
+        the protocol banner and the other two at their '└─' connector
     """
-    unique_hostnames = set()
-    
-    for agent in agent_tree:
-        # Add root agent hostname
-        hostname = agent.get('Hostname', '').lower()
-        if hostname:
-            unique_hostnames.add(hostname)
+    key = agent_render_key(agent, is_new)
+    cached = RENDER_CACHE.get(agent.id)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    # Extract agent info
+    is_session = agent.type == 'session'
+    host_id = agent.short_id
+    label = agent.label
+    remote_ip = agent.remote_address
+    
+    # Precomputed in build_agent_tree
+    privileged = agent.privileged
+    pc_icon = agent.pc_icon
+    
+    # Determine colors based on status
+    if agent.status == 'dead':
+        host_color = Colors.GRAY
+        username_style = Colors.BOLD_GRAY
+        protocol_color = Colors.GRAY
+        status_marker = f" {Colors.RED}💀{Colors.ENDC}"
+        type_label = "session [DEAD]" if is_session else "beacon [DEAD]"
+    else:
+        # Alive - normal colors
+        if is_session:
+            host_color = Colors.GREEN
+            type_label = "session"
+        else:
+            host_color = Colors.YELLOW
+            type_label = "beacon"
         
-        # Add children hostnames
-        for child in agent.get('children', []):
-            child_hostname = child.get('Hostname', '').lower()
-            if child_hostname:
-                unique_hostnames.add(child_hostname)
-    
-    return len(unique_hostnames)
+        protocol_color = agent.protocol_color
+        username_style = Colors.BOLD_RED if privileged else Colors.BOLD_CYAN
+        status_marker = ""
+    
+    # Status indicator
+    status_icon = "◆" if is_session else "◇"
+    
+    # Privilege indicator
+    priv_badge = f" {Colors.CYAN}💎{Colors.ENDC}" if privileged else ""
+    
+    # NEW badge for recently seen agents
+    new_badge = f" {Colors.GREEN}✨ NEW!{Colors.ENDC}" if is_new else ""
+    
+    # Adjacent spans sharing a color are emitted as one run
+    lines = (
+        f"[ {protocol_color}{agent.transport_upper:^6}{Colors.ENDC} ]────────▶ "
+        f"{host_color}{status_icon} {pc_icon}{Colors.ENDC} "
+        f"{username_style}{label}{Colors.ENDC}{priv_badge}{status_marker}",
+        f"└─ ID: {Colors.GRAY}{host_id} ({type_label}){Colors.ENDC}{new_badge}",
+        f"└─ IP: {Colors.CYAN}{remote_ip}{Colors.ENDC}",
+    )
+    RENDER_CACHE[agent.id] = (key, lines)
+    return lines
 
 
-def calculate_stats(agent_tree):
+def draw_graph(agent_tree, total_sessions, total_beacons, last_update=None, changes=None, buf=None):
     """
-    Calculate detailed statistics from agent tree
+    Draw the main network graph visualization with hierarchical tree
     
-    Returns:
-        dict with various statistics
+    The frame is written into buf (a StringIO, cleared first) and returned as
+    a string. By default the module-level FRAME_BUFFER is reused so no new
+    buffer is allocated per frame.
     """
+    # Bind colors to locals to skip repeated class attribute lookups
+    BOLD, ENDC = Colors.BOLD, Colors.ENDC
+    GRAY, RED, GREEN = Colors.GRAY, Colors.RED, Colors.GREEN
+    BOLD_RED, BOLD_GREEN = Colors.BOLD_RED, Colors.BOLD_GREEN
+    BOLD_YELLOW, BOLD_CYAN = Colors.BOLD_YELLOW, Colors.BOLD_CYAN
+    
+    if buf is None:
+        buf = FRAME_BUFFER
+    buf.seek(0)
+    buf.truncate()
+    write = buf.write
+    
+    # Header
+    write("\n")
+    write(HEADER)
+    
+    # Show last update time
+    if last_update:
+        write(format_update_line(last_update))
+        write("\n")
+    
+    # Show change summary at the top
+    if changes:
+        if changes['new_count'] > 0:
+            write(f"{GREEN}  ✨ {changes['new_count']} new agent(s) detected{ENDC}\n")
+        if changes['lost_count'] > 0:
+            write(f"{RED}  🔴 {changes['lost_count']} agent(s) lost connection{ENDC}\n")
+    
+    write("\n")
+    
+    # Calculate totals
+    total_agents = total_sessions + total_beacons
+    
+    if total_agents == 0:
+        write(f"{RED}                    ⚠️  [No Active Hosts Connected]{ENDC}\n")
+        return buf.getvalue()
+    
+    # Total content lines: 3 per root, 4 per child (connector + 3 lines),
+    # plus 2 spacing lines between roots. Every agent is either a root or a
+    # child, so with R roots this is 3R + 4(drawn_agents - R) + 2(R - 1)
+    drawn_agents = sum(1 + len(root.children) for root in agent_tree)
+    total_content_lines = 4 * drawn_agents + len(agent_tree) - 2
+    logo_start = total_content_lines // 2 - len(LOGO_CELLS) // 2
+    if logo_start < 0:
+        logo_start = 0
+    
+    # Logo column for every content line: the C2 server logo (cells are
+    # pre-colored and padded) centered vertically, blank padding elsewhere
+    logo_column = [BLANK_LOGO_CELL] * max(total_content_lines, logo_start + len(LOGO_CELLS))
+    logo_column[logo_start:logo_start + len(LOGO_CELLS)] = LOGO_CELLS
+    
+    # Statistics are tallied while drawing so the tree is only walked once
     stats = {
         'total_agents': 0,
         'privileged': 0,
         'unprivileged': 0,
         'windows': 0,
         'linux': 0,
-        'other_os': 0,
+        'other': 0,
         'protocols': {},
         'new_agents': 0,
         'dead_agents': 0,
     }
+    unique_hostnames = set()
     
-    def count_agent(agent):
+    def count_agent(agent, is_new):
         stats['total_agents'] += 1
         
-        # Count privileged
-        username = agent.get('Username', '')
-        uid = agent.get('UID', '')
-        os_name = agent.get('OS', '')
+        # Count unique compromised hosts based on hostname
+        hostname = agent.hostname_lower
+        if hostname:
+            unique_hostnames.add(hostname)
         
-        if is_privileged(username, uid, os_name):
+        # Count privileged
+        if agent.privileged:
             stats['privileged'] += 1
         else:
             stats['unprivileged'] += 1
         
         # Count OS types
-        os_lower = os_name.lower()
-        if 'windows' in os_lower:
-            stats['windows'] += 1
-        elif 'linux' in os_lower:
-            stats['linux'] += 1
-        else:
-            stats['other_os'] += 1
+        stats[agent.os_key] += 1
         
         # Count protocols
-        transport = agent.get('Transport', 'unknown').upper()
+        transport = agent.transport_upper
         stats['protocols'][transport] = stats['protocols'].get(transport, 0) + 1
         
         # Count new agents
-        if is_agent_new(agent['ID']):
+        if is_new:
             stats['new_agents'] += 1
         
         # Count dead agents
-        if is_dead_or_late(agent.get('IsDead', False), 0, agent['type']) == 'dead':
+        if agent.status == 'dead':
             stats['dead_agents'] += 1
     
-    # Process all agents in tree
-    for agent in agent_tree:
-        count_agent(agent)
-        for child in agent.get('children', []):
-            count_agent(child)
-    
-    return stats
-
-
-def draw_graph(agent_tree, total_sessions, total_beacons, last_update=None, changes=None):
-    """Draw the main network graph visualization with hierarchical tree"""
-    output = []
-    
-    # Header
-    output.append("")
-    output.append(f"{Colors.BOLD}{Colors.CYAN}╔════════════════════════════════════════════════════════════════════════════╗{Colors.ENDC}")
-    output.append(f"{Colors.BOLD}{Colors.CYAN}║  🎯 SLIVER C2 - NETWORK TOPOLOGY VISUALIZATION                            ║{Colors.ENDC}")
-    output.append(f"{Colors.BOLD}{Colors.CYAN}╚════════════════════════════════════════════════════════════════════════════╝{Colors.ENDC}")
-    
-    # Show last update time
-    if last_update:
-        update_time = datetime.fromtimestamp(last_update).strftime("%Y-%m-%d %H:%M:%S")
-        output.append(f"{Colors.GRAY}  ⏰ Last Update: {update_time}  |  Press Ctrl+C to exit{Colors.ENDC}")
-    
-    # Show change summary at the top
-    if changes:
-        if changes['new_count'] > 0:
-            output.append(f"{Colors.GREEN}  ✨ {changes['new_count']} new agent(s) detected{Colors.ENDC}")
-        if changes['lost_count'] > 0:
-            output.append(f"{Colors.RED}  🔴 {changes['lost_count']} agent(s) lost connection{Colors.ENDC}")
-    
-    output.append("")
-    
-    # Calculate totals - use unique host count for compromised hosts
-    total_agents = total_sessions + total_beacons
-    unique_hosts = count_unique_hosts(agent_tree)
-    
-    if total_agents == 0:
-        output.append(f"{Colors.RED}                    ⚠️  [No Active Hosts Connected]{Colors.ENDC}")
-        output.append("")
-        return '\n'.join(output)
-    
-    # Draw the C2 server logo
-    logo_lines = draw_sliver_logo()
+    line_count = 0
     
-    # Calculate total lines needed for content (with spacing)
-    content_lines = []
-    for idx, agent in enumerate(agent_tree):
-        # Root agent: 3 lines (username@host, ID, IP)
-        content_lines.append(3)
+    def write_agent(agent, connector, continuation):
+        """Write an agent's three lines (summary, ID, IP) behind the given prefixes"""
+        nonlocal line_count
         
-        # Children with vertical connectors
-        children = agent.get('children', [])
-        if children:
-            for child_idx, child in enumerate(children):
-                content_lines.append(1)  # Vertical line
-                content_lines.append(3)  # Child agent: 3 lines (username@host, ID, IP)
+        # NEW badge for recently seen agents
+        is_new = is_agent_new(agent.id)
+        count_agent(agent, is_new)
+        summary, id_line, ip_line = render_agent_lines(agent, is_new)
         
-        # Spacing between root agents (except last)
-        if idx < len(agent_tree) - 1:
-            content_lines.append(2)  # Double line spacing
-    
-    total_content_lines = sum(content_lines)
-    logo_start = total_content_lines // 2 - len(logo_lines) // 2
-    if logo_start < 0:
-        logo_start = 0
-    
-    line_count = 0
+        write(f"  {logo_column[line_count]}{connector}{summary}\n")
+        write(f"  {logo_column[line_count + 1]}{continuation}{id_line}\n")
+        write(f"  {logo_column[line_count + 2]}{continuation}{ip_line}\n")
+        line_count += 3
     
     # Draw each root agent and its children
     for idx, agent in enumerate(agent_tree):
-        # Extract agent info
-        is_session = agent['type'] == 'session'
-        host_id = agent['ID'][:8]
-        hostname = agent.get('Hostname', 'Unknown')
-        username = agent.get('Username', 'Unknown')
-        os_name = agent.get('OS', 'Unknown')
-        transport = agent.get('Transport', 'unknown')
-        uid = agent.get('UID', '')
-        
-        # Check if privileged
-        privileged = is_privileged(username, uid, os_name)
-        
-        # Check if agent is dead
-        agent_status = is_dead_or_late(
-            agent.get('IsDead', False),
-            agent.get('NextCheckin', 0),
-            agent['type']
-        )
-        
-        # Determine colors based on status
-        if agent_status == 'dead':
-            host_color = Colors.GRAY
-            username_color = Colors.GRAY
-            protocol_color = Colors.GRAY
-            status_marker = f" {Colors.RED}💀{Colors.ENDC}"
-            type_label = "session [DEAD]" if is_session else "beacon [DEAD]"
-        else:
-            # Alive - normal colors
-            if is_session:
-                host_color = Colors.GREEN
-                type_label = "session"
-            else:
-                host_color = Colors.YELLOW
-                type_label = "beacon"
-            
-            protocol_color = get_protocol_color(transport)
-            username_color = Colors.RED if privileged else Colors.CYAN
-            status_marker = ""
-        
-        # Get logo line or empty space
-        def get_logo_line(line_num):
-            if line_num >= logo_start and line_num < logo_start + len(logo_lines):
-                return f"{Colors.MAGENTA}{logo_lines[line_num - logo_start]:12}{Colors.ENDC}"
-            return " " * 12
-        
-        # Emoji icons based on OS and type
-        if 'windows' in os_name.lower():
-            pc_icon = "🖥️ " if is_session else "💻"
-        elif 'linux' in os_name.lower():
-            pc_icon = "🐧" if is_session else "🖳 "
-        else:
-            pc_icon = "💻" if is_session else "🖥️ "
-        
-        # Status indicator
-        status_icon = "◆" if is_session else "◇"
-        
-        # Privilege indicator
-        priv_badge = f" {Colors.CYAN}💎{Colors.ENDC}" if privileged else ""
-        
-        # NEW badge for recently seen agents
-        new_badge = ""
-        if is_agent_new(agent['ID']):
-            new_badge = f" {Colors.GREEN}✨ NEW!{Colors.ENDC}"
-        
-        # Format root agent line with longer connectors (multi-line display)
-        remote_ip = agent.get('RemoteAddress', 'Unknown')
-        
-        # Line 1: Protocol connector + icon + username@hostname
-        logo_line = get_logo_line(line_count)
-        output.append(
-            f"  {logo_line}      ╰────────[ {protocol_color}{transport.upper():^6}{Colors.ENDC} ]────────▶ "
-            f"{host_color}{status_icon}{Colors.ENDC} {host_color}{pc_icon}{Colors.ENDC} "
-            f"{Colors.BOLD}{username_color}{username}@{hostname}{Colors.ENDC}{priv_badge}{status_marker}"
-        )
-        line_count += 1
-        
-        # Line 2: ID and type with NEW badge
-        logo_line = get_logo_line(line_count)
-        output.append(
-            f"  {logo_line}                                               "
-            f"└─ ID: {Colors.GRAY}{host_id} ({type_label}){Colors.ENDC}{new_badge}"
-        )
-        line_count += 1
-        
-        # Line 3: IP address
-        logo_line = get_logo_line(line_count)
-        output.append(
-            f"  {logo_line}                                               "
-            f"└─ IP: {Colors.CYAN}{remote_ip}{Colors.ENDC}"
-        )
-        line_count += 1
+        # Root agents get the longer connector
+        write_agent(agent, "      ╰────────", " " * 47)
         
         # Draw children (pivoted agents)
-        children = agent.get('children', [])
+        children = agent.children
         for child_idx, child in enumerate(children):
             is_last_child = child_idx == len(children) - 1
             
             # Add vertical connector line
-            logo_line = get_logo_line(line_count)
-            output.append(f"  {logo_line}           │")
+            write(f"  {logo_column[line_count]}           │\n")
             line_count += 1
             
-            # Extract child info
-            child_is_session = child['type'] == 'session'
-            child_id = child['ID'][:8]
-            child_hostname = child.get('Hostname', 'Unknown')
-            child_username = child.get('Username', 'Unknown')
-            child_os = child.get('OS', 'Unknown')
-            child_transport = child.get('Transport', 'unknown')
-            child_uid = child.get('UID', '')
-            
-            # Check if child is privileged
-            child_privileged = is_privileged(child_username, child_uid, child_os)
-            
-            # Check if child is dead
-            child_status_check = is_dead_or_late(
-                child.get('IsDead', False),
-                child.get('NextCheckin', 0),
-                child['type']
-            )
-            
-            # Determine child colors based on status
-            if child_status_check == 'dead':
-                child_color = Colors.GRAY
-                child_username_color = Colors.GRAY
-                child_protocol_color = Colors.GRAY
-                child_status_marker = f" {Colors.RED}💀{Colors.ENDC}"
-                child_type = "session [DEAD]" if child_is_session else "beacon [DEAD]"
-            else:
-                # Alive - normal colors
-                if child_is_session:
-                    child_color = Colors.GREEN
-                    child_type = "session"
-                else:
-                    child_color = Colors.YELLOW
-                    child_type = "beacon"
-                
-                child_protocol_color = get_protocol_color(child_transport)
-                child_username_color = Colors.RED if child_privileged else Colors.CYAN
-                child_status_marker = ""
-            
-            # Child emoji icons
-            if 'windows' in child_os.lower():
-                child_icon = "🖥️ " if child_is_session else "💻"
-            elif 'linux' in child_os.lower():
-                child_icon = "🐧" if child_is_session else "🖳 "
-            else:
-                child_icon = "💻" if child_is_session else "🖥️ "
-            
-            # Child status indicator
-            child_status = "◆" if child_is_session else "◇"
-            
-            # Child privilege indicator
-            child_priv_badge = f" {Colors.CYAN}💎{Colors.ENDC}" if child_privileged else ""
-            
-            # NEW badge for recently seen child agents
-            child_new_badge = ""
-            if is_agent_new(child['ID']):
-                child_new_badge = f" {Colors.GREEN}✨ NEW!{Colors.ENDC}"
-            
-            # Tree branch for child
+            # Tree branch for child, with the trunk continuing past it unless last
             child_branch = "╰─" if is_last_child else "├─"
-            
-            # Format child line with indentation (multi-line display)
-            child_remote_ip = child.get('RemoteAddress', 'Unknown')
-            
-            # Line 1: Protocol connector + icon + username@hostname
-            logo_line = get_logo_line(line_count)
-            output.append(
-                f"  {logo_line}           {child_branch}───────[ {child_protocol_color}{child_transport.upper():^6}{Colors.ENDC} ]────────▶ "
-                f"{child_color}{child_status}{Colors.ENDC} {child_color}{child_icon}{Colors.ENDC} "
-                f"{Colors.BOLD}{child_username_color}{child_username}@{child_hostname}{Colors.ENDC}{child_priv_badge}{child_status_marker}"
-            )
-            line_count += 1
-            
-            # Line 2: ID and type with NEW badge
-            logo_line = get_logo_line(line_count)
-            continuation = "│" if not is_last_child else " "
-            output.append(
-                f"  {logo_line}           {continuation}                                      "
-                f"└─ ID: {Colors.GRAY}{child_id} ({child_type}){Colors.ENDC}{child_new_badge}"
-            )
-            line_count += 1
-            
-            # Line 3: IP address
-            logo_line = get_logo_line(line_count)
-            output.append(
-                f"  {logo_line}           {continuation}                                      "
-                f"└─ IP: {Colors.CYAN}{child_remote_ip}{Colors.ENDC}"
-            )
-            line_count += 1
+            trunk = " " if is_last_child else "│"
+            write_agent(child, f"           {child_branch}───────", f"           {trunk}{' ' * 38}")
         
         # Add spacing between root agents (except last)
         if idx < len(agent_tree) - 1:
-            logo_line = get_logo_line(line_count)
-            output.append(f"  {logo_line}")
-            line_count += 1
-            logo_line = get_logo_line(line_count)
-            output.append(f"  {logo_line}")
-            line_count += 1
+            write(f"  {logo_column[line_count]}\n")
+            write(f"  {logo_column[line_count + 1]}\n")
+            line_count += 2
     
-    # Calculate detailed statistics
-    stats = calculate_stats(agent_tree)
+    unique_hosts = len(unique_hostnames)
     
-    output.append("")
-    output.append(f"{Colors.GRAY}{'━' * 80}{Colors.ENDC}")
+    write("\n")
+    write(f"{GRAY}{'━' * 80}{ENDC}\n")
     
-    # Compact single-line stats footer
-    stats_line = f"🟢 Sessions: {Colors.BOLD}{Colors.GREEN}{total_sessions}{Colors.ENDC}  "
-    stats_line += f"🟡 Beacons: {Colors.BOLD}{Colors.YELLOW}{total_beacons}{Colors.ENDC}  "
-    stats_line += f"🔵 Hosts: {Colors.BOLD}{Colors.CYAN}{unique_hosts}{Colors.ENDC}  "
+    # Compact single-line stats footer, written straight into the frame buffer
+    write(f"🟢 Sessions: {BOLD_GREEN}{total_sessions}{ENDC}  "
+          f"🟡 Beacons: {BOLD_YELLOW}{total_beacons}{ENDC}  "
+          f"🔵 Hosts: {BOLD_CYAN}{unique_hosts}{ENDC}  ")
     
     if stats['new_agents'] > 0:
-        stats_line += f"✨ New: {Colors.BOLD}{Colors.GREEN}{stats['new_agents']}{Colors.ENDC}  "
+        write(f"✨ New: {BOLD_GREEN}{stats['new_agents']}{ENDC}  ")
     
-    stats_line += f"🔴 Privileged: {Colors.BOLD}{Colors.RED}{stats['privileged']}{Colors.ENDC}  "
-    stats_line += f"🟢 Standard: {Colors.BOLD}{Colors.GREEN}{stats['unprivileged']}{Colors.ENDC}  "
+    write(f"🔴 Privileged: {BOLD_RED}{stats['privileged']}{ENDC}  "
+          f"🟢 Standard: {BOLD_GREEN}{stats['unprivileged']}{ENDC}  ")
     
-    # OS breakdown
     # OS breakdown
     os_parts = []
     if stats['windows'] > 0:
-        os_parts.append(f"Windows({Colors.BOLD}{stats['windows']}{Colors.ENDC})")
+        os_parts.append(f"Windows({BOLD}{stats['windows']}{ENDC})")
     if stats['linux'] > 0:
-        os_parts.append(f"Linux({Colors.BOLD}{stats['linux']}{Colors.ENDC})")
-    if stats['other_os'] > 0:
-        os_parts.append(f"Other({Colors.BOLD}{stats['other_os']}{Colors.ENDC})")
+        os_parts.append(f"Linux({BOLD}{stats['linux']}{ENDC})")
+    if stats['other'] > 0:
+        os_parts.append(f"Other({BOLD}{stats['other']}{ENDC})")
     
     if os_parts:
-        stats_line += f"💻 OS: " + " ".join(os_parts) + "  "
+        write(f"💻 OS: {' '.join(os_parts)}  ")
     
-    stats_line += f"  🔗 Protocols: "
+    write("  🔗 Protocols: ")
     
     # Protocol breakdown
-    proto_parts = []
-    for proto, count in sorted(stats['protocols'].items()):
-        proto_color = get_protocol_color(proto.lower())
-        proto_parts.append(f"{proto_color}{proto}{Colors.ENDC}({Colors.BOLD}{count}{Colors.ENDC})")
-    stats_line += " ".join(proto_parts)
-    
-    output.append(stats_line)
+    write(" ".join(
+        f"{get_protocol_color(proto.lower())}{proto}{ENDC}({BOLD}{count}{ENDC})"
+        for proto, count in sorted(stats['protocols'].items())
+    ))
+    write("\n")
     
     # Display recently lost agents
     if LOST_AGENTS:
-        output.append("")
-        output.append(f"{Colors.RED}🔴 Recently Lost Connections:{Colors.ENDC}")
-        for agent_id, data in sorted(LOST_AGENTS.items(), key=lambda x: x[1]['lost_time'], reverse=True):
+        write("\n")
+        write(f"{RED}🔴 Recently Lost Connections:{ENDC}\n")
+        # Newest first (LOST_AGENTS is kept in lost_time order)
+        for agent_id, data in reversed(LOST_AGENTS.items()):
             agent = data['agent']
-            lost_time = data['lost_time']
-            time_ago = int(time.time() - lost_time)
+            time_str = format_time_ago(data['lost_time'])
             
-            # Format time ago
-            if time_ago < 60:
-                time_str = f"{time_ago}s ago"
-            else:
-                time_str = f"{time_ago // 60}m ago"
+            agent_type = agent.type
             
-            username = agent.get('Username', 'Unknown')
-            hostname = agent.get('Hostname', 'Unknown')
-            agent_type = agent.get('type', 'unknown')
-            
-            output.append(f"  {Colors.GRAY}◇ {username}@{hostname}  {agent_id[:8]} ({agent_type}) - {time_str}{Colors.ENDC}")
+            write(f"  {GRAY}◇ {agent.label}  {agent.short_id} ({agent_type}) - {time_str}{ENDC}\n")
+    
+    return buf.getvalue()
+
+
+@dataclass
+class Agent:
+    """
+    A session or beacon as drawn in the graph
     
-    output.append("")
+    Slotted for compact records and fast attribute access. The derived
+    fields after 'children' are not dataclass fields: annotate_agent sets
+    them right after the record is built.
+    """
+    __slots__ = (
+        'id', 'hostname', 'username', 'os', 'transport', 'proxy_url',
+        'remote_address', 'uid', 'is_dead', 'next_checkin', 'type', 'children',
+        # Derived fields, filled in by annotate_agent
+        'os_lower', 'os_key', 'transport_lower', 'transport_upper',
+        'username_lower', 'hostname_lower', 'privileged', 'status',
+        'protocol_color', 'pc_icon', 'short_id', 'label',
+    )
     
-    return '\n'.join(output)
+    id: str
+    hostname: str
+    username: str
+    os: str
+    transport: str
+    proxy_url: str
+    remote_address: str
+    uid: str
+    is_dead: bool
+    next_checkin: int
+    type: str  # 'session' or 'beacon'
+    children: list  # Pivoted agents
+
+
+def annotate_agent(agent):
+    """
+    Precompute the derived fields used by draw_graph and its stats footer
+    
+    Called once per agent while building the tree so rendering and stats
+    never re-derive them. Fills in the following Agent fields:
+        os_lower, transport_lower, username_lower, hostname_lower:
+            Lowercased fields
+        transport_upper: Uppercased transport, as displayed
+        os_key: OS family ('windows', 'linux' or 'other')
+        privileged: Result of is_privileged
+        status: Result of is_dead_or_late ('dead' or 'alive')
+        protocol_color: Color for the agent's transport
+        pc_icon: Emoji icon for the agent's OS and type
+        short_id: First 8 characters of the agent ID
+        label: 'username@hostname' display label
+    """
+    os_lower = agent.os.lower() if agent.os else ''
+    
+    agent.os_lower = os_lower
+    agent.os_key = normalize_os(os_lower)
+    agent.transport_lower = agent.transport.lower() if agent.transport else ''
+    agent.transport_upper = agent.transport.upper() if agent.transport else ''
+    agent.username_lower = agent.username.lower() if agent.username else ''
+    agent.hostname_lower = agent.hostname.lower() if agent.hostname else ''
+    agent.privileged = is_privileged(agent.username_lower, agent.uid, os_lower)
+    agent.status = is_dead_or_late(agent.is_dead, agent.next_checkin, agent.type)
+    agent.protocol_color = get_protocol_color(agent.transport_lower)
+    agent.pc_icon = PC_ICONS[(agent.os_key, agent.type == 'session')]
+    agent.short_id = agent.id[:8]
+    agent.label = f"{agent.username}@{agent.hostname}"
+
+
+def find_pivot_parent(pivoted, roots_by_id, roots_by_hostname):
+    """
+    Find the root agent a pivoted agent connects through
+    
+    Args:
+        pivoted: Pivoted Agent
+        roots_by_id: Dict of root ID -> root Agent
+        roots_by_hostname: Dict of hostname -> list of root Agents
+    
+    Returns:
+        The parent Agent, or None if no root matches
+    """
+    # If ProxyURL is set, try to extract parent info
+    if pivoted.proxy_url:
+        # ProxyURL format might be: tcp://parentID or similar
+        tokens = PROXY_URL_TOKEN_RE.findall(pivoted.proxy_url)
+        
+        # Try to find parent by ID, then by hostname, in proxy URL
+        parent = next((roots_by_id[t] for t in tokens if t in roots_by_id), None)
+        if parent is None:
+            parent = next((roots_by_hostname[t][0] for t in tokens if t in roots_by_hostname), None)
+        
+        # Rare: the ID or hostname is only part of a token (e.g. an FQDN)
+        if parent is None:
+            proxy_url = pivoted.proxy_url
+            parent = next((root for root in roots_by_id.values()
+                           if root.id in proxy_url
+                           or (root.hostname and root.hostname in proxy_url)), None)
+        
+        if parent is not None:
+            return parent
+    
+    # If transport indicates pivot type, try to match by network
+    # For named pipes or TCP pivots, match if same hostname
+    # (likely pivoting through that host)
+    if SAME_HOST_PIVOT_RE.search(pivoted.transport_lower):
+        candidates = roots_by_hostname.get(pivoted.hostname)
+        if candidates:
+            return candidates[0]
+    
+    return None
 
 
 def build_agent_tree(sessions, beacons):
     """Build hierarchical tree structure from agents based on pivot relationships"""
-    # Convert to dict format with pivot info
+    global PIVOT_CACHE, PIVOT_CACHE_ROOTS
+    
+    # Convert to Agent records (only the fields the tree, renderer and stats
+    # read; the messages themselves are not kept)
     all_agents = {}
     
     for s in sessions:
-        agent_id = s.ID
-        all_agents[agent_id] = {
-            'ID': s.ID,
-            'Hostname': s.Hostname,
-            'Username': s.Username,
-            'OS': s.OS,
-            'Transport': s.Transport,
-            'ProxyURL': s.ProxyURL,
-            'PeerID': s.PeerID,
-            'RemoteAddress': s.RemoteAddress,
-            'UID': s.UID,
-            'IsDead': s.IsDead,
-            'LastCheckin': getattr(s, 'LastCheckin', 0),
-            'NextCheckin': 0,  # Sessions don't have NextCheckin
-            'type': 'session',
-            'children': []
-        }
+        all_agents[s.ID] = Agent(
+            id=s.ID,
+            hostname=s.Hostname,
+            username=s.Username,
+            os=s.OS,
+            transport=s.Transport,
+            proxy_url=s.ProxyURL,
+            remote_address=s.RemoteAddress,
+            uid=s.UID,
+            is_dead=s.IsDead,
+            next_checkin=0,  # Sessions don't have NextCheckin
+            type='session',
+            children=[],
+        )
     
     for b in beacons:
-        agent_id = b.ID
-        all_agents[agent_id] = {
-            'ID': b.ID,
-            'Hostname': b.Hostname,
-            'Username': b.Username,
-            'OS': b.OS,
-            'Transport': b.Transport,
-            'ProxyURL': b.ProxyURL,
-            'RemoteAddress': b.RemoteAddress,
-            'UID': b.UID,
-            'IsDead': b.IsDead,
-            'LastCheckin': b.LastCheckin,
-            'NextCheckin': b.NextCheckin,
-            'type': 'beacon',
-            'children': []
-        }
+        all_agents[b.ID] = Agent(
+            id=b.ID,
+            hostname=b.Hostname,
+            username=b.Username,
+            os=b.OS,
+            transport=b.Transport,
+            proxy_url=b.ProxyURL,
+            remote_address=b.RemoteAddress,
+            uid=b.UID,
+            is_dead=b.IsDead,
+            next_checkin=b.NextCheckin,
+            type='beacon',
+            children=[],
+        )
     
     # Build tree by detecting parent-child relationships
     # Agents with ProxyURL or pivot transports are children
@@ -730,106 +975,398 @@ def build_agent_tree(sessions, beacons):
     pivoted_agents = []
     
     for agent_id, agent in all_agents.items():
-        transport_lower = agent['Transport'].lower()
+        annotate_agent(agent)
+        transport_lower = agent.transport_lower
         
-        # Check if agent is pivoted
-        is_pivoted = (
-            agent['ProxyURL'] or  # Has proxy configured
-            'pivot' in transport_lower or  # TCP pivot, etc.
-            'namedpipe' in transport_lower or  # Windows named pipe
-            'bind' in transport_lower  # Bind connection
-        )
+        # Check if agent is pivoted: has a proxy configured, or uses a
+        # TCP pivot, Windows named pipe or bind connection transport
+        is_pivoted = agent.proxy_url or PIVOT_TRANSPORT_RE.search(transport_lower)
         
         if is_pivoted:
             pivoted_agents.append(agent)
         else:
             root_agents.append(agent)
     
+    # Index roots so parents are looked up instead of scanned for
+    roots_by_id = {root.id: root for root in root_agents}
+    roots_by_hostname = {}
+    for root in root_agents:
+        roots_by_hostname.setdefault(root.hostname, []).append(root)
+    
+    # Parent resolutions are cached per ProxyURL/hostname/transport, and only
+    # trusted while the roots they were resolved against are unchanged. Order
+    # matters too: the first root with a matching hostname wins
+    root_keys = tuple((root.id, root.hostname) for root in root_agents)
+    if root_keys != PIVOT_CACHE_ROOTS:
+        PIVOT_CACHE = {}
+        PIVOT_CACHE_ROOTS = root_keys
+    pivot_cache = {}  # Keeps only the entries still in use
+    use_cache = True  # Cleared once a fallback root joins the indexes
+    
     # Try to match pivoted agents to their parents
     for pivoted in pivoted_agents:
-        parent_found = False
-        
-        # If ProxyURL is set, try to extract parent info
-        if pivoted['ProxyURL']:
-            # ProxyURL format might be: tcp://parentID or similar
-            proxy_url = pivoted['ProxyURL']
-            
-            # Try to find parent by matching hostname or ID in proxy URL
-            for root in root_agents:
-                if root['ID'] in proxy_url or root['Hostname'] in proxy_url:
-                    root['children'].append(pivoted)
-                    parent_found = True
-                    break
-        
-        # If transport indicates pivot type, try to match by network
-        if not parent_found:
-            transport = pivoted['Transport'].lower()
-            
-            # For named pipes or TCP pivots, try to match by hostname
-            if 'namedpipe' in transport or 'pivot' in transport:
-                for root in root_agents:
-                    # Match if same hostname (likely pivoting through that host)
-                    if root['Hostname'] == pivoted['Hostname']:
-                        root['children'].append(pivoted)
-                        parent_found = True
-                        break
+        key = (pivoted.proxy_url, pivoted.hostname, pivoted.transport_lower)
+        if use_cache and key in PIVOT_CACHE:
+            parent_id = PIVOT_CACHE[key]
+        else:
+            parent = find_pivot_parent(pivoted, roots_by_id, roots_by_hostname)
+            parent_id = parent.id if parent is not None else None
+        if use_cache:
+            pivot_cache[key] = parent_id
         
-        # If still no parent found, add to root (fallback)
-        if not parent_found:
+        if parent_id is not None:
+            roots_by_id[parent_id].children.append(pivoted)
+        else:
+            # If still no parent found, add to root (fallback). It can still
+            # be the parent of pivoted agents after it, which the cache
+            # (resolved against the original roots only) can't account for
             root_agents.append(pivoted)
+            roots_by_id[pivoted.id] = pivoted
+            roots_by_hostname.setdefault(pivoted.hostname, []).append(pivoted)
+            use_cache = False
     
+    PIVOT_CACHE = pivot_cache
     return root_agents
 
 
-async def get_sliver_data(config_file):
-    """Connect to Sliver and get sessions/beacons"""
-    # Connect to Sliver
+def load_config(config_file):
+    """
+    Parse the Sliver client config, reusing the last parse if unchanged
+    
+    Reconnects happen repeatedly while the server is unreachable, so the
+    parsed config is cached and only re-read when the file's mtime changes.
+    """
+    global CONFIG_CACHE
+    
+    mtime = config_file.stat().st_mtime
+    if CONFIG_CACHE is not None and CONFIG_CACHE[:2] == (config_file, mtime):
+        return CONFIG_CACHE[2]
+    
     config = SliverClientConfig.parse_config_file(str(config_file))
+    CONFIG_CACHE = (config_file, mtime, config)
+    return config
+
+
+async def connect_sliver(config_file):
+    """Parse the client config and open a connection to the Sliver server"""
+    config = load_config(config_file)
     client = SliverClient(config)
     await client.connect()
+    return client
+
+
+class SliverConnection:
+    """
+    Holder for the current SliverClient
+    
+    Shared by the renderer and supervise_connection so the supervisor can
+    swap in a fresh client; the renderer reads .client on every refresh.
+    """
+    
+    def __init__(self, config_file):
+        self.config_file = config_file
+        self.client = None
     
-    # Get sessions and beacons
-    sessions = await client.sessions()
-    beacons = await client.beacons()
+    async def connect(self):
+        """(Re)connect and replace the current client"""
+        self.client = await connect_sliver(self.config_file)
+
+
+async def supervise_connection(connection):
+    """
+    Keep the shared Sliver connection alive
+    
+    Pings the server every KEEPALIVE_INTERVAL seconds and reconnects when the
+    ping fails or times out, so a silently dropped gRPC channel isn't polled
+    forever. A failed reconnect is retried on the next ping; meanwhile the
+    renderer's own errors still trigger monitor_loop's retry path.
+    """
+    while True:
+        await asyncio.sleep(KEEPALIVE_INTERVAL)
+        try:
+            await asyncio.wait_for(connection.client.version(), KEEPALIVE_TIMEOUT)
+        except Exception:
+            try:
+                await connection.connect()
+            except Exception:
+                pass
+
+
+async def get_sliver_data(client):
+    """Get sessions/beacons from an already connected Sliver client"""
+    # Get sessions and beacons concurrently (independent RPCs)
+    sessions_task = asyncio.ensure_future(client.sessions())
+    beacons_task = asyncio.ensure_future(client.beacons())
+    try:
+        sessions, beacons = await asyncio.gather(sessions_task, beacons_task)
+    except BaseException:
+        # gather leaves the other RPC running when one of them fails
+        sessions_task.cancel()
+        beacons_task.cancel()
+        raise
     
     return sessions, beacons
 
 
-def signal_handler(sig, frame):
-    """Handle Ctrl+C gracefully"""
-    print(f"\n\n{Colors.YELLOW}[*] Exiting... Goodbye!{Colors.ENDC}\n")
-    sys.exit(0)
+def agent_list_signature(sessions, beacons):
+    """
+    Cheap signature of the raw session/beacon lists
+    
+    Covers every field build_agent_tree and the renderer read, so an equal
+    signature means the previously built agent tree can be reused as is.
+    Lengths come first so differently sized lists compare unequal at once.
+    """
+    return (
+        len(sessions),
+        len(beacons),
+        tuple((s.ID, s.Hostname, s.Username, s.OS, s.Transport, s.ProxyURL,
+               s.RemoteAddress, s.UID, s.IsDead) for s in sessions),
+        tuple((b.ID, b.Hostname, b.Username, b.OS, b.Transport, b.ProxyURL,
+               b.RemoteAddress, b.UID, b.IsDead) for b in beacons),
+    )
+
+
+def render_agents(sessions, beacons):
+    """
+    Rebuild the agent tree and redraw the graph
+    
+    The monitoring loops run this in a worker thread (asyncio.to_thread).
+    Calls never overlap, since each loop awaits one render before the next,
+    so the module-level render state needs no locking.
+    
+    Returns:
+        dict with 'new_count', 'lost_count' keys (see track_agent_changes)
+    """
+    global LAST_FRAME_FINGERPRINT, LAST_AGENT_SIGNATURE, LAST_AGENT_TREE
+    
+    # Build hierarchical tree structure, unless the agent lists are unchanged
+    signature = agent_list_signature(sessions, beacons)
+    if signature == LAST_AGENT_SIGNATURE:
+        agent_tree = LAST_AGENT_TREE
+    else:
+        agent_tree = build_agent_tree(sessions, beacons)
+        LAST_AGENT_SIGNATURE = signature
+        LAST_AGENT_TREE = agent_tree
+    
+    # Track changes in agents
+    changes = track_agent_changes(agent_tree)
+    
+    now = time.time()
+    fingerprint = frame_fingerprint(agent_tree, len(sessions), len(beacons), changes)
+    
+    if fingerprint == LAST_FRAME_FINGERPRINT and PREVIOUS_FRAME:
+        # Nothing visible changed: only the timestamp line needs rewriting
+        render_update_line(format_update_line(now))
+    else:
+        # Draw the graph, only rewriting lines that changed
+        graph = draw_graph(agent_tree, len(sessions), len(beacons), now, changes)
+        render_frame(graph)
+    
+    LAST_FRAME_FINGERPRINT = fingerprint
+    
+    return changes
 
 
-async def monitor_loop(config_file, refresh_interval=5):
-    """Main monitoring loop that refreshes the display"""
+async def poll_agents(connection, refresh_interval, max_refresh_interval):
+    """
+    Refresh the display by polling sessions/beacons on an interval
+    
+    The wait between refreshes doubles after every cycle without new or lost
+    agents (up to max_refresh_interval) and snaps back to refresh_interval as
+    soon as a change is detected. Intervals are measured from the start of
+    each refresh, so RPC latency does not stretch the refresh period.
+    """
+    interval = refresh_interval
+    
     while True:
-        try:
-            # Get data from Sliver
-            sessions, beacons = await get_sliver_data(config_file)
+        cycle_start = time.monotonic()
+        
+        # Get data from Sliver (through the supervisor's current client)
+        sessions, beacons = await get_sliver_data(connection.client)
+        changes = await asyncio.to_thread(render_agents, sessions, beacons)
+        
+        # Back off while idle, poll quickly again once agents change
+        if changes['new_count'] or changes['lost_count']:
+            interval = refresh_interval
+        else:
+            interval = min(interval * 2, max_refresh_interval)
+        
+        # Wait out the rest of the interval; the fetch and render time count
+        # towards it, so a refresh starts every max(interval, fetch + render)
+        await asyncio.sleep(max(0, cycle_start + interval - time.monotonic()))
+
+
+def apply_session_event(event, sessions_by_id):
+    """
+    Apply a session event to the session map
+    
+    Returns:
+        True if the event was a session event, False otherwise
+    """
+    if event.EventType in SESSION_UPSERT_EVENTS:
+        sessions_by_id[event.Session.ID] = event.Session
+    elif event.EventType in SESSION_REMOVE_EVENTS:
+        sessions_by_id.pop(event.Session.ID, None)
+    else:
+        return False
+    return True
+
+
+async def apply_events(client, sessions_by_id, beacons_by_id, dirty, journal):
+    """
+    Apply Sliver server events to the cached session/beacon maps
+    
+    Args:
+        client: Connected SliverClient
+        sessions_by_id: Dict of session ID -> session, updated in place
+        beacons_by_id: Dict of beacon ID -> beacon, updated in place
+        dirty: asyncio.Event set whenever the maps change
+        journal: List every applied event is appended to, so watch_agents can
+            replay the ones that arrive while a snapshot is in flight
+    """
+    try:
+        async for event in client.events():
+            if event.EventType in BEACON_EVENTS:
+                # Beacon events carry a serialized payload, just re-list them
+                beacons = await client.beacons()
+                beacons_by_id.clear()
+                beacons_by_id.update((b.ID, b) for b in beacons)
+            elif not apply_session_event(event, sessions_by_id):
+                continue
             
-            # Build hierarchical tree structure
-            agent_tree = build_agent_tree(sessions, beacons)
+            journal.append(event)
+            dirty.set()
+    finally:
+        # Wake the renderer so it notices the stream ended
+        dirty.set()
+
+
+async def watch_agents(connection, refresh_interval, resync_interval):
+    """
+    Refresh the display from Sliver's event stream instead of polling
+    
+    A full sessions/beacons snapshot seeds the agent maps (and is repeated every
+    resync_interval to catch changes that don't produce events, such as beacons
+    going dead or being removed). Events that arrive while a snapshot is in
+    flight are replayed over it once it lands, so they aren't lost until the
+    next resync. In between, only server events mutate the maps and trigger a
+    redraw. Bursts of events are coalesced to at most MAX_REDRAWS_PER_SECOND,
+    and a redraw waits for a burst to go quiet for EVENT_DEBOUNCE seconds.
+    The display is still redrawn every refresh_interval so NEW badges and
+    lost-agent timers age correctly. If supervise_connection replaces the
+    client, the event stream is resubscribed on the new one.
+    """
+    sessions_by_id = {}
+    beacons_by_id = {}
+    dirty = asyncio.Event()
+    journal = []
+    client = connection.client
+    events_task = asyncio.create_task(apply_events(client, sessions_by_id, beacons_by_id, dirty, journal))
+    next_resync = 0
+    
+    try:
+        while True:
+            if connection.client is not client:
+                # The supervisor reconnected: resubscribe and resync
+                events_task.cancel()
+                client = connection.client
+                events_task = asyncio.create_task(apply_events(client, sessions_by_id, beacons_by_id,
+                                                               dirty, journal))
+                next_resync = 0
+            elif events_task.done():
+                # Re-raise stream errors so monitor_loop reconnects
+                events_task.result()
+                raise ConnectionError("Sliver event stream closed")
             
-            # Track changes in agents
-            changes = track_agent_changes(agent_tree)
+            # Only events applied during a snapshot need replaying
+            journal.clear()
             
-            # Clear screen and draw the graph
-            clear_screen()
-            graph = draw_graph(agent_tree, len(sessions), len(beacons), time.time(), changes)
-            print(graph)
+            if time.monotonic() >= next_resync:
+                sessions, beacons = await get_sliver_data(client)
+                sessions_by_id.clear()
+                sessions_by_id.update((s.ID, s) for s in sessions)
+                beacons_by_id.clear()
+                beacons_by_id.update((b.ID, b) for b in beacons)
+                
+                # The snapshot may predate events applied while it was in
+                # flight: replay them in order over it
+                relist_beacons = False
+                for event in journal:
+                    if not apply_session_event(event, sessions_by_id):
+                        relist_beacons = True
+                journal.clear()
+                if relist_beacons:
+                    beacons = await client.beacons()
+                    beacons_by_id.clear()
+                    beacons_by_id.update((b.ID, b) for b in beacons)
+                
+                next_resync = time.monotonic() + resync_interval
             
-            # Wait before next refresh
-            await asyncio.sleep(refresh_interval)
+            dirty.clear()
+            # Render off the event loop so server events keep being applied
+            await asyncio.to_thread(render_agents, list(sessions_by_id.values()),
+                                    list(beacons_by_id.values()))
+            
+            # Coalesce bursts of events into a single redraw
+            await asyncio.sleep(1 / MAX_REDRAWS_PER_SECOND)
+            try:
+                await asyncio.wait_for(dirty.wait(), refresh_interval)
+            except asyncio.TimeoutError:
+                continue
+            
+            # Let the burst settle: draw once events stop for EVENT_DEBOUNCE,
+            # but no later than one redraw period after the first event
+            settle_by = time.monotonic() + 1 / MAX_REDRAWS_PER_SECOND
+            while not events_task.done() and time.monotonic() < settle_by:
+                dirty.clear()
+                try:
+                    await asyncio.wait_for(dirty.wait(), EVENT_DEBOUNCE)
+                except asyncio.TimeoutError:
+                    break
+    finally:
+        events_task.cancel()
+
+
+async def monitor_loop(config_file, refresh_interval=5, max_refresh_interval=60, use_events=True,
+                       resync_interval=10):
+    """
+    Main monitoring loop that refreshes the display
+    
+    Uses Sliver's event stream by default (see watch_agents, with a full
+    resync every resync_interval) or interval polling when use_events is False (see poll_agents), alongside a
+    supervise_connection keepalive task. On any error the connection is
+    re-established with exponential backoff.
+    """
+    # Connect once and reuse the client for every refresh
+    connection = SliverConnection(config_file)
+    retry_delay = refresh_interval
+    
+    # Show progress until the first frame replaces the startup messages
+    write_terminal(f"{Colors.CYAN}[*] Connecting to Sliver server...{Colors.ENDC}\n")
+    
+    while True:
+        try:
+            await connection.connect()
+            retry_delay = refresh_interval
+            
+            supervisor = asyncio.create_task(supervise_connection(connection))
+            try:
+                if use_events:
+                    await watch_agents(connection, refresh_interval, resync_interval)
+                else:
+                    await poll_agents(connection, refresh_interval, max_refresh_interval)
+            finally:
+                supervisor.cancel()
             
-        except KeyboardInterrupt:
-            print(f"\n\n{Colors.YELLOW}[*] Exiting... Goodbye!{Colors.ENDC}\n")
-            sys.exit(0)
         except Exception as e:
-            clear_screen()
-            print(f"{Colors.RED}[!] Error: {e}{Colors.ENDC}")
-            print(f"{Colors.YELLOW}[*] Retrying in {refresh_interval} seconds...{Colors.ENDC}")
-            await asyncio.sleep(refresh_interval)
+            # Reconnect on the next attempt, backing off exponentially
+            PREVIOUS_FRAME.clear()
+            write_terminal(
+                f"{CLEAR_SCREEN}{Colors.RED}[!] Error: {e}{Colors.ENDC}\n"
+                f"{Colors.YELLOW}[*] Reconnecting in {retry_delay} seconds...{Colors.ENDC}\n"
+            )
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, MAX_RECONNECT_DELAY)
 
 
 def main():
@@ -841,17 +1378,28 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog='''
 Examples:
-  python3 sliver-graph.py              # Default 5 second refresh
-  python3 sliver-graph.py -r 10        # Refresh every 10 seconds
+  python3 sliver-graph.py              # Live updates from Sliver's event stream
+  python3 sliver-graph.py --resync 30  # Same, with a full resync every 30 seconds
+  python3 sliver-graph.py --poll       # Poll every 5 seconds, backing off to 60s when idle
+  python3 sliver-graph.py --poll -r 10 # Poll every 10 seconds while agents are changing
+  python3 sliver-graph.py --poll --max-refresh 5  # Fixed 5 second polling (no idle backoff)
   python3 sliver-graph.py --once       # Run once without loop
         '''
     )
-    parser.add_argument('-r', '--refresh', type=int, default=5, 
-                        help='Refresh interval in seconds (default: 5)')
+    parser.add_argument('-r', '--refresh', '--min-refresh', type=int, default=5, 
+                        help='Minimum refresh interval in seconds (default: 5)')
+    parser.add_argument('--max-refresh', type=int, default=60,
+                        help='Maximum refresh interval when no agents change (default: 60)')
+    parser.add_argument('--resync', type=int, default=10,
+                        help='Full sessions/beacons resync interval in event mode, to catch beacons '
+                             'that go dead or are removed without an event (default: 10)')
+    parser.add_argument('--poll', action='store_true',
+                        help='Poll sessions/beacons instead of subscribing to server events')
     parser.add_argument('--once', action='store_true',
                         help='Run once and exit (no live monitoring)')
     
     args = parser.parse_args()
+    args.max_refresh = max(args.max_refresh, args.refresh)
     
     if not HAS_SLIVER_PY:
         print(f"{Colors.RED}[!] This script requires sliver-py{Colors.ENDC}")
@@ -859,8 +1407,8 @@ Examples:
         print(f"{Colors.YELLOW}[*] Or install from source: https://github.com/moloch--/sliver-py{Colors.ENDC}")
         sys.exit(1)
     
-    # Set up signal handler for Ctrl+C
-    signal.signal(signal.SIGINT, signal_handler)
+    enable_ansi()
+    setup_stdout()
     
     # Look for Sliver config file
     config_path = Path.home() / ".sliver-client" / "configs"
@@ -871,52 +1419,71 @@ Examples:
         sys.exit(1)
     
     # Get the first config file
-    config_files = list(config_path.glob("*.cfg"))
-    if not config_files:
+    config_file = next(config_path.glob("*.cfg"), None)
+    if config_file is None:
         print(f"{Colors.RED}[!] No Sliver config files found{Colors.ENDC}")
         sys.exit(1)
     
-    config_file = config_files[0]
-    
     if args.once:
         # Run once and exit
         print(f"{Colors.CYAN}[*] Using config: {config_file.name}{Colors.ENDC}")
         
         async def run_once():
-            sessions, beacons = await get_sliver_data(config_file)
-            agent_tree = build_agent_tree(sessions, beacons)
-            
-            # Track changes (even in once mode, to initialize state)
-            changes = track_agent_changes(agent_tree)
-            
-            clear_screen()
-            graph = draw_graph(agent_tree, len(sessions), len(beacons), time.time(), changes)
-            print(graph)
+            client = await connect_sliver(config_file)
+            sessions, beacons = await get_sliver_data(client)
+            render_agents(sessions, beacons)
         
         try:
             asyncio.run(run_once())
+        except KeyboardInterrupt:
+            print(f"\n\n{Colors.YELLOW}[*] Exiting... Goodbye!{Colors.ENDC}\n")
+            sys.exit(0)
         except Exception as e:
             print(f"{Colors.RED}[!] Error: {e}{Colors.ENDC}")
             sys.exit(1)
     else:
         # Run in monitoring mode
         print(f"{Colors.CYAN}[*] Using config: {config_file.name}{Colors.ENDC}")
-        print(f"{Colors.CYAN}[*] Refresh interval: {args.refresh} seconds{Colors.ENDC}")
-        print(f"{Colors.CYAN}[*] Starting live monitoring... (Press Ctrl+C to exit){Colors.ENDC}")
-        time.sleep(2)
+        if args.poll:
+            print(f"{Colors.CYAN}[*] Refresh interval: {args.refresh}-{args.max_refresh} seconds{Colors.ENDC}")
+        else:
+            print(f"{Colors.CYAN}[*] Watching Sliver events (full resync every {args.resync} seconds){Colors.ENDC}")
+        print(f"{Colors.CYAN}[*] Starting live monitoring... (Press Ctrl+C to exit){Colors.ENDC}", flush=True)
         
+        async def run_monitor():
+            task = asyncio.ensure_future(monitor_loop(config_file, refresh_interval=args.refresh,
+                                                      max_refresh_interval=args.max_refresh,
+                                                      use_events=not args.poll,
+                                                      resync_interval=args.resync))
+            
+            # Ctrl+C cancels the loop right away, even mid-sleep or mid-RPC
+            try:
+                asyncio.get_running_loop().add_signal_handler(signal.SIGINT, task.cancel)
+            except NotImplementedError:
+                pass  # Windows: Ctrl+C still arrives as KeyboardInterrupt
+            
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        
+        # Hide the cursor while frames are redrawn in place
+        write_terminal(HIDE_CURSOR)
         try:
             # Run the monitoring loop
-            asyncio.run(monitor_loop(config_file, refresh_interval=args.refresh))
+            asyncio.run(run_monitor())
+            print(f"\n\n{Colors.YELLOW}[*] Exiting... Goodbye!{Colors.ENDC}\n")
             
         except KeyboardInterrupt:
             print(f"\n\n{Colors.YELLOW}[*] Exiting... Goodbye!{Colors.ENDC}\n")
             sys.exit(0)
         except Exception as e:
-            print(f"{Colors.RED}[!] Error: {e}{Colors.ENDC}")
+            print(f"{Colors.RED}[!] Error: {e}{Colors.ENDC}", flush=True)
             import traceback
             traceback.print_exc()
             sys.exit(1)
+        finally:
+            write_terminal(SHOW_CURSOR)
 
 
 if __name__ == '__main__':